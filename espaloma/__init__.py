@@ -3,7 +3,7 @@ espaloma
 Extensible Surrogate Potential of Ab initio Learned and Optimized by Message-passing Algorithm
 """
 
-from . import metrics, units, data, app, graphs, mm, nn
+from . import metrics, units, data, app, graphs, mm, nn, utils
 from .app.experiment import *
 from .graphs.graph import Graph
 from .metrics import GraphMetric
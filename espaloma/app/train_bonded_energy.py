@@ -35,6 +35,18 @@ def run(args):
 
     data = data.apply(simulation.run, in_place=True)
 
+    # precompute geometry
+    # NOTE:
+    # coordinates are fixed during training, so bond lengths, angles and
+    # dihedrals are constants---compute them once here instead of once
+    # per epoch inside the net
+    def assign_geometry(g):
+        with torch.no_grad():
+            esp.mm.geometry.geometry_in_graph(g.heterograph)
+        return g
+
+    data = data.apply(assign_geometry, in_place=True)
+
     # split
     partition = [int(x) for x in args.partition.split(":")]
     ds_tr, ds_te = data.split(partition)
@@ -60,7 +72,6 @@ def run(args):
     net = torch.nn.Sequential(
         representation,
         readout,
-        esp.mm.geometry.GeometryInGraph(),
         esp.mm.energy.EnergyInGraph(),
         esp.mm.energy.EnergyInGraph(suffix="_ref"),
     )
@@ -259,10 +259,60 @@ class Dataset(abc.ABC, torch.utils.data.Dataset):
         return self.__class__(self.graphs + x.graphs)
 
 
+# NOTE:
+# the molecule collection is shipped to each worker once through the
+# pool initializer, so individual tasks only carry an integer index
+# instead of pickling a molecule (or the collection) per task
+_molecules_shared_with_workers = None
+
+
+def _initialize_worker(molecules):
+    global _molecules_shared_with_workers
+    _molecules_shared_with_workers = molecules
+
+
+def _make_graph(idx):
+    """Make a graph from the `idx`-th shared molecule.
+
+    Module-level so it is picklable for `multiprocessing`.
+    """
+    return esp.Graph(_molecules_shared_with_workers[idx])
+
+
+# number of molecules pulled from a generator input at a time
+_STREAM_CHUNK_SIZE = 256
+
+
+def _graph_from_molecule(molecule):
+    """Make a graph from a molecule or SMILES; pass anything else through.
+
+    Module-level so it is picklable for `multiprocessing`.
+    """
+    from openff.toolkit.topology import Molecule
+
+    if isinstance(molecule, (Molecule, str)):
+        return esp.Graph(molecule)
+
+    return molecule
+
+
 class GraphDataset(Dataset):
     """Dataset with additional support for only viewing
     certain attributes as `torch.utils.data.DataLoader`
 
+    Parameters
+    ----------
+    graphs : List or iterable
+        objects in the dataset; a generator is consumed lazily so that
+        large molecule collections are streamed rather than held in
+        memory at once.
+
+    n_workers : int
+        number of processes used to construct graphs from molecules;
+        construction is independent across molecules so it parallelizes
+        across cores. Generator inputs are fed to the workers in
+        bounded chunks.
+
     Methods
     -------
     view(collate_fn, *args, **kwargs)
@@ -271,20 +321,58 @@ class GraphDataset(Dataset):
     Note
     """
 
-    def __init__(self, graphs=[], first=None):
+    def __init__(self, graphs=[], first=None, n_workers=1):
         super(GraphDataset, self).__init__()
         from openff.toolkit.topology import Molecule
 
-        if all(
+        if not isinstance(graphs, (list, tuple)):
+            # a generator or other lazy iterable: consume it one
+            # molecule at a time so the full input collection is never
+            # held in memory alongside the constructed graphs
+            from itertools import islice
+
+            if first is not None and first != -1:
+                graphs = islice(graphs, first)
+
+            if n_workers > 1:
+                from multiprocessing import Pool
+
+                # pull bounded chunks off the stream so the pool stays
+                # busy while at most one chunk of inputs is in memory
+                _graphs = []
+                with Pool(n_workers) as pool:
+                    while True:
+                        chunk = list(islice(graphs, _STREAM_CHUNK_SIZE))
+                        if len(chunk) == 0:
+                            break
+                        _graphs.extend(
+                            pool.map(_graph_from_molecule, chunk)
+                        )
+                graphs = _graphs
+
+            else:
+                graphs = [_graph_from_molecule(graph) for graph in graphs]
+
+        elif all(
             isinstance(graph, Molecule) or isinstance(graph, str)
             for graph in graphs
         ):
 
-            if first is None or first == -1:
-                graphs = [esp.Graph(graph) for graph in graphs]
+            if first is not None and first != -1:
+                graphs = graphs[:first]
+
+            if n_workers > 1:
+                from multiprocessing import Pool
+
+                with Pool(
+                    n_workers,
+                    initializer=_initialize_worker,
+                    initargs=(graphs,),
+                ) as pool:
+                    graphs = pool.map(_make_graph, range(len(graphs)))
 
             else:
-                graphs = [esp.Graph(graph) for graph in graphs[:first]]
+                graphs = [esp.Graph(graph) for graph in graphs]
 
         self.graphs = graphs
 
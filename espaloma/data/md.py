@@ -45,6 +45,15 @@ def add_nonbonded_force(
         topology,
     )
 
+    # assign each force to its own group so the state queries below can
+    # evaluate the nonbonded forces only, instead of zeroing out the
+    # valence parameters and paying for full-system evaluations
+    nonbonded_groups = set()
+    for group, force in enumerate(system.getForces()):
+        force.setForceGroup(group)
+        if "Nonbonded" in force.__class__.__name__:
+            nonbonded_groups.add(group)
+
     # use langevin integrator, although it's not super useful here
     integrator = openmm.LangevinIntegrator(
         TEMPERATURE, COLLISION_RATE, STEP_SIZE
@@ -55,60 +64,10 @@ def add_nonbonded_force(
         topology=topology, system=system, integrator=integrator
     )
 
-    # get forces
-    forces = list(system.getForces())
-
-    # loop through forces
-    for force in forces:
-        name = force.__class__.__name__
-
-        # turn off angle
-        if "Angle" in name:
-            for idx in range(force.getNumAngles()):
-                id1, id2, id3, angle, k = force.getAngleParameters(idx)
-                force.setAngleParameters(idx, id1, id2, id3, angle, 0.0)
-
-            force.updateParametersInContext(simulation.context)
-
-        elif "Bond" in name:
-            for idx in range(force.getNumBonds()):
-                id1, id2, length, k = force.getBondParameters(idx)
-                force.setBondParameters(
-                    idx,
-                    id1,
-                    id2,
-                    length,
-                    0.0,
-                )
-
-            force.updateParametersInContext(simulation.context)
-
-        elif "Torsion" in name:
-            for idx in range(force.getNumTorsions()):
-                (
-                    id1,
-                    id2,
-                    id3,
-                    id4,
-                    periodicity,
-                    phase,
-                    k,
-                ) = force.getTorsionParameters(idx)
-                force.setTorsionParameters(
-                    idx,
-                    id1,
-                    id2,
-                    id3,
-                    id4,
-                    periodicity,
-                    phase,
-                    0.0,
-                )
-
-            force.updateParametersInContext(simulation.context)
-
-        elif "Nonbonded" in name:
-            if add_charges == False:
+    # turn off charges
+    if add_charges == False:
+        for force in system.getForces():
+            if "Nonbonded" in force.__class__.__name__:
                 for idx in range(force.getNumParticles()):
                     q, sigma, epsilon = force.getParticleParameters(idx)
                     force.setParticleParameters(idx, q * 1e-8, sigma, epsilon)
@@ -137,28 +96,31 @@ def add_nonbonded_force(
     )
 
     # loop through the snapshots
-    energies = []
-    derivatives = []
+    # NOTE:
+    # preallocate the result arrays and fill them in place; the state
+    # query is the only per-snapshot work left
+    energies = np.empty(xs.shape[0])
+    derivatives = np.empty(xs.shape)
 
-    for x in xs:
+    for idx, x in enumerate(xs):
         simulation.context.setPositions(x)
 
         state = simulation.context.getState(
             getEnergy=True,
-            getParameters=True,
             getForces=True,
+            groups=nonbonded_groups,
         )
 
-        energy = state.getPotentialEnergy().value_in_unit(
+        energies[idx] = state.getPotentialEnergy().value_in_unit(
             esp.units.ENERGY_UNIT,
         )
 
-        derivative = state.getForces(asNumpy=True).value_in_unit(
-            esp.units.FORCE_UNIT,
-        ) * -1
-
-        energies.append(energy)
-        derivatives.append(derivative)
+        derivatives[idx] = (
+            state.getForces(asNumpy=True).value_in_unit(
+                esp.units.FORCE_UNIT,
+            )
+            * -1
+        )
 
     # put energies to a tensor
     energies = torch.tensor(
@@ -166,7 +128,7 @@ def add_nonbonded_force(
         dtype=torch.get_default_dtype(),
     ).flatten()[None, :]
     derivatives = torch.tensor(
-        np.stack(derivatives, axis=1),
+        derivatives.transpose(1, 0, 2),
         dtype=torch.get_default_dtype(),
     )
 
@@ -217,28 +179,31 @@ def get_coulomb_force(
     )
 
     # loop through the snapshots
-    energies = []
-    derivatives = []
-
-    for x in xs:
+    # NOTE:
+    # preallocate the result arrays and fill them in place; the state
+    # query is the only per-snapshot work left, and `getParameters` is
+    # not requested since the parameters are never read
+    energies = np.empty(xs.shape[0])
+    derivatives = np.empty(xs.shape)
+
+    for idx, x in enumerate(xs):
         simulation.context.setPositions(x)
 
         state = simulation.context.getState(
             getEnergy=True,
-            getParameters=True,
             getForces=True,
         )
 
-        energy = state.getPotentialEnergy().value_in_unit(
+        energies[idx] = state.getPotentialEnergy().value_in_unit(
             esp.units.ENERGY_UNIT,
         )
 
-        derivative = state.getForces(asNumpy=True).value_in_unit(
-            esp.units.FORCE_UNIT,
-        ) * -1
-
-        energies.append(energy)
-        derivatives.append(derivative)
+        derivatives[idx] = (
+            state.getForces(asNumpy=True).value_in_unit(
+                esp.units.FORCE_UNIT,
+            )
+            * -1
+        )
 
     # put energies to a tensor
     energies = torch.tensor(
@@ -246,7 +211,7 @@ def get_coulomb_force(
         dtype=torch.get_default_dtype(),
     ).flatten()[None, :]
     derivatives = torch.tensor(
-        np.stack(derivatives, axis=1),
+        derivatives.transpose(1, 0, 2),
         dtype=torch.get_default_dtype(),
     )
 
@@ -269,39 +234,31 @@ def get_coulomb_force(
                 )
             force.updateParametersInContext(simulation.context)
 
-    # the snapshots
-    xs = (
-        Quantity(
-            g.nodes["n1"].data["xyz"].detach().numpy(),
-            esp.units.DISTANCE_UNIT,
-        )
-        .value_in_unit(unit.nanometer)
-        .transpose((1, 0, 2))
-    )
-
     # loop through the snapshots
-    new_energies = []
-    new_derivatives = []
+    # NOTE:
+    # `xs` is unchanged since the first pass, so reuse it instead of
+    # converting the coordinates through the unit package again
+    new_energies = np.empty(xs.shape[0])
+    new_derivatives = np.empty(xs.shape)
 
-    for x in xs:
+    for idx, x in enumerate(xs):
         simulation.context.setPositions(x)
 
         state = simulation.context.getState(
             getEnergy=True,
-            getParameters=True,
             getForces=True,
         )
 
-        energy = state.getPotentialEnergy().value_in_unit(
+        new_energies[idx] = state.getPotentialEnergy().value_in_unit(
             esp.units.ENERGY_UNIT,
         )
 
-        derivative = state.getForces(asNumpy=True).value_in_unit(
-            esp.units.FORCE_UNIT,
-        ) * -1
-
-        new_energies.append(energy)
-        new_derivatives.append(derivative)
+        new_derivatives[idx] = (
+            state.getForces(asNumpy=True).value_in_unit(
+                esp.units.FORCE_UNIT,
+            )
+            * -1
+        )
 
     # put energies to a tensor
     new_energies = torch.tensor(
@@ -310,7 +267,7 @@ def get_coulomb_force(
     ).flatten()[None, :]
 
     new_derivatives = torch.tensor(
-        np.stack(new_derivatives, axis=1),
+        new_derivatives.transpose(1, 0, 2),
         dtype=torch.get_default_dtype(),
     )
 
@@ -452,28 +409,31 @@ def subtract_nonbonded_force(
     )
 
     # loop through the snapshots
-    energies = []
-    derivatives = []
-
-    for x in xs:
+    # NOTE:
+    # preallocate the result arrays and fill them in place; the state
+    # query is the only per-snapshot work left, and `getParameters` is
+    # not requested since the parameters are never read
+    energies = np.empty(xs.shape[0])
+    derivatives = np.empty(xs.shape)
+
+    for idx, x in enumerate(xs):
         simulation.context.setPositions(x)
 
         state = simulation.context.getState(
             getEnergy=True,
-            getParameters=True,
             getForces=True,
         )
 
-        energy = state.getPotentialEnergy().value_in_unit(
+        energies[idx] = state.getPotentialEnergy().value_in_unit(
             esp.units.ENERGY_UNIT,
         )
 
-        derivative = state.getForces(asNumpy=True).value_in_unit(
-            esp.units.FORCE_UNIT,
-        ) * -1
-
-        energies.append(energy)
-        derivatives.append(derivative)
+        derivatives[idx] = (
+            state.getForces(asNumpy=True).value_in_unit(
+                esp.units.FORCE_UNIT,
+            )
+            * -1
+        )
 
     # put energies to a tensor
     energies = torch.tensor(
@@ -481,7 +441,7 @@ def subtract_nonbonded_force(
         dtype=torch.get_default_dtype(),
     ).flatten()[None, :]
     derivatives = torch.tensor(
-        np.stack(derivatives, axis=1),
+        derivatives.transpose(1, 0, 2),
         dtype=torch.get_default_dtype(),
     )
 
@@ -606,28 +566,31 @@ def subtract_nonbonded_force_except_14(
     )
 
     # loop through the snapshots
-    energies = []
-    derivatives = []
-
-    for x in xs:
+    # NOTE:
+    # preallocate the result arrays and fill them in place; the state
+    # query is the only per-snapshot work left, and `getParameters` is
+    # not requested since the parameters are never read
+    energies = np.empty(xs.shape[0])
+    derivatives = np.empty(xs.shape)
+
+    for idx, x in enumerate(xs):
         simulation.context.setPositions(x)
 
         state = simulation.context.getState(
             getEnergy=True,
-            getParameters=True,
             getForces=True,
         )
 
-        energy = state.getPotentialEnergy().value_in_unit(
+        energies[idx] = state.getPotentialEnergy().value_in_unit(
             esp.units.ENERGY_UNIT,
         )
 
-        derivative = state.getForces(asNumpy=True).value_in_unit(
-            esp.units.FORCE_UNIT,
-        ) * -1
-
-        energies.append(energy)
-        derivatives.append(derivative)
+        derivatives[idx] = (
+            state.getForces(asNumpy=True).value_in_unit(
+                esp.units.FORCE_UNIT,
+            )
+            * -1
+        )
 
     # put energies to a tensor
     energies = torch.tensor(
@@ -635,7 +598,7 @@ def subtract_nonbonded_force_except_14(
         dtype=torch.get_default_dtype(),
     ).flatten()[None, :]
     derivatives = torch.tensor(
-        np.stack(derivatives, axis=1),
+        derivatives.transpose(1, 0, 2),
         dtype=torch.get_default_dtype(),
     )
 
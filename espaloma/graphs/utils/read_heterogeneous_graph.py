@@ -114,13 +114,33 @@ def from_homogeneous_and_mol(g, offmol):
     hg[("n1", "n1_neighbors_n1", "n1")] = idxs["n2"]
 
     # build a mapping between indices and the ordering
-    idxs_to_ordering = {}
+    # NOTE:
+    # instead of a Python dict keyed on tuples, encode each row of atom
+    # indices as a single integer (base n_atoms) and look orderings up
+    # with np.searchsorted---this replaces the per-row Python loops with
+    # C-level sort and search
+    n_atoms = g.number_of_nodes()
+
+    def _encode_rows(rows):
+        rows = np.asarray(rows, dtype=np.int64)
+        keys = np.zeros(rows.shape[0], dtype=np.int64)
+        for col in rows.T:
+            keys = keys * n_atoms + col
+        return keys
+
+    idxs_keys = {}
+    idxs_orderings = {}
 
     for term in ["n1", "n2", "n3", "n4", "n4_improper"]:
-        idxs_to_ordering[term] = {
-            tuple(subgraph_idxs): ordering
-            for (ordering, subgraph_idxs) in enumerate(list(idxs[term]))
-        }
+        keys = _encode_rows(idxs[term])
+        orderings = np.argsort(keys)
+        idxs_keys[term] = keys[orderings]
+        idxs_orderings[term] = orderings
+
+    def _ordering(term, rows):
+        return idxs_orderings[term][
+            np.searchsorted(idxs_keys[term], _encode_rows(rows))
+        ]
 
     # ===============================================
     # relationships between nodes of different levels
@@ -144,13 +164,11 @@ def from_homogeneous_and_mol(g, offmol):
                     )
                 ] = np.stack(
                     [
-                        np.array(
-                            [
-                                idxs_to_ordering["n%s" % small_idx][tuple(x)]
-                                for x in idxs["n%s" % big_idx][
-                                    :, pos_idx : pos_idx + small_idx
-                                ]
-                            ]
+                        _ordering(
+                            "n%s" % small_idx,
+                            idxs["n%s" % big_idx][
+                                :, pos_idx : pos_idx + small_idx
+                            ],
                         ),
                         np.arange(idxs["n%s" % big_idx].shape[0]),
                     ],
@@ -166,13 +184,11 @@ def from_homogeneous_and_mol(g, offmol):
                 ] = np.stack(
                     [
                         np.arange(idxs["n%s" % big_idx].shape[0]),
-                        np.array(
-                            [
-                                idxs_to_ordering["n%s" % small_idx][tuple(x)]
-                                for x in idxs["n%s" % big_idx][
-                                    :, pos_idx : pos_idx + small_idx
-                                ]
-                            ]
+                        _ordering(
+                            "n%s" % small_idx,
+                            idxs["n%s" % big_idx][
+                                :, pos_idx : pos_idx + small_idx
+                            ],
                         ),
                     ],
                     axis=1,
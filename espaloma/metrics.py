@@ -302,10 +302,14 @@ class GraphDerivativeMetric(Metric):
             allow_unused=True,
         )[0]
 
+        # NOTE:
+        # the target derivative is reference data---nothing
+        # backpropagates through it---so there is no need to build the
+        # double-backward graph (`create_graph=True`) on this side
         target_prime = torch.autograd.grad(
             target_fn(g_target).sum(),
             self.d(g_target),
-            create_graph=True,
+            create_graph=False,
             retain_graph=True,
             allow_unused=True,
         )[0]
@@ -31,6 +31,41 @@ def linear_mixture_to_original(k1, k2, b1, b2):
     return k, b
 
 
+# =============================================================================
+# KERNELS
+# =============================================================================
+# NOTE:
+# TorchScript-compiled kernels for the terms evaluated inside the
+# training hot loop, so that the elementwise chains are fused instead of
+# materializing one intermediate per op.
+@torch.jit.script
+def _harmonic_quadratic(
+    x: torch.Tensor, k: torch.Tensor, eq: torch.Tensor
+) -> torch.Tensor:
+    delta = x - eq
+    return 0.5 * k * delta * delta
+
+
+@torch.jit.script
+def _periodic_kernel(
+    x: torch.Tensor,
+    k: torch.Tensor,
+    periodicity: torch.Tensor,
+    phases: torch.Tensor,
+) -> torch.Tensor:
+    cos_n_theta_minus_phases = (
+        periodicity * x.unsqueeze(-1) - phases
+    ).cos()
+
+    k = k.unsqueeze(1)
+
+    return (
+        torch.nn.functional.relu(k) * (cos_n_theta_minus_phases + 1.0)
+        - torch.nn.functional.relu(0.0 - k)
+        * (cos_n_theta_minus_phases - 1.0)
+    ).sum(dim=-1)
+
+
 # =============================================================================
 # MODULE FUNCTIONS
 # =============================================================================
@@ -50,6 +85,14 @@ def harmonic(x, k, eq, order=[2]):
     """
 
     if isinstance(order, list):
+        if order == [2]:
+            # hot path: plain harmonic term;
+            # fuse the evaluation instead of going through
+            # the pow / permute machinery below,
+            # which materializes a (len(order), batch_size, n_snapshots)
+            # intermediate
+            return _harmonic_quadratic(x, k, eq)
+
         order = torch.tensor(order, device=x.device)
 
     return (
@@ -93,25 +136,16 @@ def periodic_fixed_phases(
     assert n_dihedrals == n_dihedrals_
     assert n_phases == n_phases_
 
-    # promote everything to this shape
+    # broadcast everything to this shape
     stacked_shape = (n_snapshots, n_dihedrals, n_phases)
 
-    # duplicate ks n_snapshots times
-    ks_stacked = torch.stack([ks] * n_snapshots, dim=0)
-    assert ks_stacked.shape == stacked_shape
-
-    # duplicate dihedral angles n_phases times
-    dihedrals_stacked = torch.stack([dihedrals] * n_phases, dim=2)
-    assert dihedrals_stacked.shape == stacked_shape
-
-    # duplicate periodicity n_snapshots * n_dihedrals times
-    ns = torch.stack(
-        [torch.stack([periodicity] * n_snapshots)] * n_dihedrals, dim=1
+    # compute k_n * cos(n * theta) for n in 1..n_phases, for each dihedral
+    # in each snapshot
+    # NOTE: broadcasting views instead of torch.stack tiles -- the tiled
+    # ks / dihedrals / periodicity arrays were pure duplication
+    energy_terms = ks[None, :, :] * torch.cos(
+        periodicity[None, None, :] * dihedrals[:, :, None]
     )
-    assert ns.shape == stacked_shape
-
-    # compute k_n * cos(n * theta) for n in 1..n_phases, for each dihedral in each snapshot
-    energy_terms = ks_stacked * torch.cos(ns * dihedrals_stacked)
     assert energy_terms.shape == stacked_shape
 
     # sum over n_dihedrals and n_phases
@@ -146,44 +180,23 @@ def periodic(
             dtype=torch.get_default_dtype(),
         )
 
+    # NOTE: broadcasting views instead of `repeat` tiles -- the tiled
+    # periodicity / phases / k arrays were pure duplication
     if periodicity.ndim == 1:
-        periodicity = periodicity[None, None, :].repeat(
-            x.shape[0], x.shape[1], 1
-        )
+        periodicity = periodicity[None, None, :]
 
     elif periodicity.ndim == 2:
-        periodicity = periodicity[:, None, :].repeat(1, x.shape[1], 1)
+        periodicity = periodicity[:, None, :]
 
     if phases.ndim == 1:
-        phases = phases[None, None, :].repeat(
-            x.shape[0],
-            x.shape[1],
-            1,
-        )
+        phases = phases[None, None, :]
 
     elif phases.ndim == 2:
-        phases = phases[:, None, :].repeat(
-            1,
-            x.shape[1],
-            1,
-        )
-
-    n_theta = periodicity * x[:, :, None]
-
-    n_theta_minus_phases = n_theta - phases
-
-    cos_n_theta_minus_phases = n_theta_minus_phases.cos()
-
-    k = k[:, None, :].repeat(1, x.shape[1], 1)
+        phases = phases[:, None, :]
 
     # energy = (k * (1.0 + cos_n_theta_minus_phases)).sum(dim=-1)
 
-    energy = (
-        torch.nn.functional.relu(k) * (cos_n_theta_minus_phases + 1.0)
-        - torch.nn.functional.relu(0.0 - k) * (cos_n_theta_minus_phases - 1.0)
-    ).sum(dim=-1)
-
-    return energy
+    return _periodic_kernel(x, k, periodicity, phases)
 
 
 # simple implementation
@@ -328,16 +341,11 @@ def harmonic_periodic_coupled(
             dtype=torch.get_default_dtype(),
         )
 
-    n_theta = (
-        periodicity[None, None, :].repeat(
-            x_periodic.shape[0], x_periodic.shape[1], 1
-        )
-        * x_periodic[:, :, None]
-    )
+    n_theta = periodicity[None, None, :] * x_periodic[:, :, None]
 
     cos_n_theta = n_theta.cos()
 
-    k = k[:, None, :].repeat(1, x_periodic.shape[1], 1)
+    k = k[:, None, :]
 
     sum_k_cos_n_theta = (k * cos_n_theta).sum(dim=-1)
 
@@ -0,0 +1,62 @@
+import pytest
+import torch
+
+
+def _batched_finite_difference(fn, x, h=1e-4):
+    """Gradient of `sum(fn(x))` w.r.t. `x` by central finite differences.
+
+    All probe points are evaluated in two batched calls (one per sign)
+    rather than one call per coordinate.
+    """
+    n = x.numel()
+    eye = torch.eye(n, dtype=x.dtype).reshape(n, *x.shape)
+
+    u_plus = fn(x[None, ...] + h * eye).sum(dim=tuple(range(1, x.ndim + 1)))
+    u_minus = fn(x[None, ...] - h * eye).sum(dim=tuple(range(1, x.ndim + 1)))
+
+    return ((u_plus - u_minus) / (2 * h)).reshape(x.shape)
+
+
+def test_harmonic_gradient():
+    import espaloma as esp
+
+    torch.manual_seed(2666)
+
+    x = torch.randn(8, 5, dtype=torch.float64, requires_grad=True)
+    k = torch.randn(8, 1, dtype=torch.float64).exp()
+    eq = torch.randn(8, 1, dtype=torch.float64)
+
+    u = esp.mm.functional.harmonic(x=x, k=k, eq=eq)
+    (du_dx,) = torch.autograd.grad(u.sum(), x)
+
+    du_dx_fd = _batched_finite_difference(
+        lambda _x: esp.mm.functional.harmonic(x=_x, k=k[None, ...], eq=eq[None, ...]),
+        x.detach(),
+    )
+
+    assert torch.allclose(du_dx, du_dx_fd, atol=1e-6)
+
+
+def test_periodic_gradient():
+    import espaloma as esp
+
+    torch.manual_seed(2666)
+
+    x = torch.randn(8, 5, dtype=torch.float64, requires_grad=True)
+    k = torch.randn(8, 6, dtype=torch.float64)
+
+    u = esp.mm.functional.periodic(x=x, k=k)
+    (du_dx,) = torch.autograd.grad(u.sum(), x)
+
+    # periodic only broadcasts over (batch, snapshot) dimensions,
+    # so flatten the probe batch into the snapshot dimension
+    def fn(x_batch):
+        n_probes = x_batch.shape[0]
+        u = esp.mm.functional.periodic(
+            x=x_batch.permute(1, 0, 2).reshape(8, -1), k=k
+        )
+        return u.reshape(8, n_probes, 5).permute(1, 0, 2)
+
+    du_dx_fd = _batched_finite_difference(fn, x.detach())
+
+    assert torch.allclose(du_dx, du_dx_fd, atol=1e-6)
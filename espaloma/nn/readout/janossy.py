@@ -116,43 +116,52 @@ class JanossyPooling(torch.nn.Module):
         )
 
         # pool
+        # NOTE:
+        # the pooled representation is shared across output features,
+        # so compute it once per node type and only keep the per-feature
+        # output heads in the comprehension
         for big_idx in self.levels:
 
             if g.number_of_nodes("n%s" % big_idx) == 0:
                 continue
 
-            g.apply_nodes(
-                func=lambda nodes: {
+            def readout(nodes, big_idx=big_idx):
+                sequential = getattr(self, "sequential_%s" % big_idx)
+
+                h = self.pool(
+                    sequential(
+                        None,
+                        torch.cat(
+                            [
+                                nodes.data["h%s" % relationship_idx]
+                                for relationship_idx in range(big_idx)
+                            ],
+                            dim=1,
+                        ),
+                    ),
+                    sequential(
+                        None,
+                        torch.cat(
+                            [
+                                nodes.data["h%s" % relationship_idx]
+                                for relationship_idx in range(
+                                    big_idx - 1, -1, -1
+                                )
+                            ],
+                            dim=1,
+                        ),
+                    ),
+                )
+
+                return {
                     feature: getattr(
                         self, "f_out_%s_to_%s" % (big_idx, feature)
-                    )(
-                        self.pool(
-                            getattr(self, "sequential_%s" % big_idx)(
-                                None,
-                                torch.cat(
-                                    [
-                                        nodes.data["h%s" % relationship_idx]
-                                        for relationship_idx in range(big_idx)
-                                    ],
-                                    dim=1,
-                                ),
-                            ),
-                            getattr(self, "sequential_%s" % big_idx)(
-                                None,
-                                torch.cat(
-                                    [
-                                        nodes.data["h%s" % relationship_idx]
-                                        for relationship_idx in range(
-                                            big_idx - 1, -1, -1
-                                        )
-                                    ],
-                                    dim=1,
-                                ),
-                            ),
-                        ),
-                    )
+                    )(h)
                     for feature in self.out_features[big_idx].keys()
-                },
+                }
+
+            g.apply_nodes(
+                func=readout,
                 ntype="n%s" % big_idx,
             )
 
@@ -160,13 +169,16 @@ class JanossyPooling(torch.nn.Module):
             return g
 
         # atom level
-        g.apply_nodes(
-            func=lambda nodes: {
-                feature: getattr(self, "f_out_1_to_%s" % feature)(
-                    self.sequential_1(g=None, x=nodes.data["h"])
-                )
+        def readout_1(nodes):
+            h = self.sequential_1(g=None, x=nodes.data["h"])
+
+            return {
+                feature: getattr(self, "f_out_1_to_%s" % feature)(h)
                 for feature in self.out_features[1].keys()
-            },
+            }
+
+        g.apply_nodes(
+            func=readout_1,
             ntype="n1",
         )
 
@@ -269,24 +281,30 @@ class JanossyPoolingImproper(torch.nn.Module):
         for big_idx in self.levels:
             inner_net = getattr(self, f"sequential_{big_idx}")
 
-            g.apply_nodes(
-                func=lambda nodes: {
+            # NOTE:
+            # the permutation-pooled representation is shared across
+            # output features, so compute it once per node type
+            def readout(nodes, big_idx=big_idx, inner_net=inner_net):
+                h = torch.sum(
+                    torch.stack(
+                        [
+                            inner_net(g=None, x=stack_permuts(nodes, p))
+                            for p in permuts
+                        ],
+                        dim=0,
+                    ),
+                    dim=0,
+                )
+
+                return {
                     feature: getattr(self, f"f_out_{big_idx}_to_{feature}")(
-                        torch.sum(
-                            torch.stack(
-                                [
-                                    inner_net(
-                                        g=None, x=stack_permuts(nodes, p)
-                                    )
-                                    for p in permuts
-                                ],
-                                dim=0,
-                            ),
-                            dim=0,
-                        )
+                        h
                     )
                     for feature in self.out_features.keys()
-                },
+                }
+
+            g.apply_nodes(
+                func=readout,
                 ntype=big_idx,
             )
 
@@ -387,24 +405,30 @@ class JanossyPoolingWithSmirnoffImproper(torch.nn.Module):
         for big_idx in self.levels:
             inner_net = getattr(self, f"sequential_{big_idx}")
 
-            g.apply_nodes(
-                func=lambda nodes: {
+            # NOTE:
+            # the permutation-pooled representation is shared across
+            # output features, so compute it once per node type
+            def readout(nodes, big_idx=big_idx, inner_net=inner_net):
+                h = torch.sum(
+                    torch.stack(
+                        [
+                            inner_net(g=None, x=stack_permuts(nodes, p))
+                            for p in permuts
+                        ],
+                        dim=0,
+                    ),
+                    dim=0,
+                )
+
+                return {
                     feature: getattr(self, f"f_out_{big_idx}_to_{feature}")(
-                        torch.sum(
-                            torch.stack(
-                                [
-                                    inner_net(
-                                        g=None, x=stack_permuts(nodes, p)
-                                    )
-                                    for p in permuts
-                                ],
-                                dim=0,
-                            ),
-                            dim=0,
-                        )
+                        h
                     )
                     for feature in self.out_features.keys()
-                },
+                }
+
+            g.apply_nodes(
+                func=readout,
                 ntype=big_idx,
             )
 
@@ -488,42 +512,50 @@ class JanossyPoolingNonbonded(torch.nn.Module):
 
         for big_idx in self.levels:
 
-            g.apply_nodes(
-                func=lambda nodes: {
+            # NOTE:
+            # the orientation-pooled representation is shared across
+            # output features, so compute it once per node type
+            def readout(nodes, big_idx=big_idx):
+                sequential = getattr(self, "sequential_%s" % big_idx)
+
+                h = torch.sum(
+                    torch.stack(
+                        [
+                            sequential(
+                                g=None,
+                                x=torch.cat(
+                                    [
+                                        nodes.data["h0"],
+                                        nodes.data["h1"],
+                                    ],
+                                    dim=1,
+                                ),
+                            ),
+                            sequential(
+                                g=None,
+                                x=torch.cat(
+                                    [
+                                        nodes.data["h1"],
+                                        nodes.data["h0"],
+                                    ],
+                                    dim=1,
+                                ),
+                            ),
+                        ],
+                        dim=0,
+                    ),
+                    dim=0,
+                )
+
+                return {
                     feature: getattr(
                         self, "f_out_%s_to_%s" % (big_idx, feature)
-                    )(
-                        torch.sum(
-                            torch.stack(
-                                [
-                                    getattr(self, "sequential_%s" % big_idx)(
-                                        g=None,
-                                        x=torch.cat(
-                                            [
-                                                nodes.data["h0"],
-                                                nodes.data["h1"],
-                                            ],
-                                            dim=1,
-                                        ),
-                                    ),
-                                    getattr(self, "sequential_%s" % big_idx)(
-                                        g=None,
-                                        x=torch.cat(
-                                            [
-                                                nodes.data["h1"],
-                                                nodes.data["h0"],
-                                            ],
-                                            dim=1,
-                                        ),
-                                    ),
-                                ],
-                                dim=0,
-                            ),
-                            dim=0,
-                        )
-                    )
+                    )(h)
                     for feature in self.out_features.keys()
-                },
+                }
+
+            g.apply_nodes(
+                func=readout,
                 ntype=big_idx,
             )
 
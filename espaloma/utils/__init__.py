@@ -0,0 +1 @@
+from . import geometry, symmetry
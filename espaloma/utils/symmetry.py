@@ -0,0 +1,218 @@
+import numpy as np
+from openff.toolkit.topology import Molecule
+
+
+def atom_symmetry_classes(offmol: Molecule) -> np.ndarray:
+    """Perceive the graph-symmetry class of each atom.
+
+    Atoms that are topologically equivalent share a symmetry class, so
+    symmetry classes can be used to deduplicate valence terms.
+
+    Returns
+    -------
+    sym : np.ndarray, shape = (n_atoms,)
+
+    Note
+    ----
+    Symmetry perception requires an OpenEye round-trip, so the result is
+    cached on the molecule and reused on subsequent calls.
+    """
+    cached = getattr(offmol, "_symmetry_classes", None)
+    if cached is not None:
+        return cached
+
+    from openeye import oechem
+
+    oemol = offmol.to_openeye()
+    oechem.OEPerceiveSymmetry(oemol)
+    sym = np.array([atom.GetSymmetryClass() for atom in oemol.GetAtoms()])
+
+    offmol._symmetry_classes = sym
+    return sym
+
+
+def _unique_bonds(offmol: Molecule, sym: np.ndarray):
+    # pull atom indices into a preallocated array in a single pass
+    pair_inds = np.fromiter(
+        (
+            ind
+            for bond in offmol.bonds
+            for ind in (bond.atom1_index, bond.atom2_index)
+        ),
+        dtype=np.int64,
+        count=2 * offmol.n_bonds,
+    ).reshape(-1, 2)
+
+    # canonicalize: (a, b) and (b, a) are the same bond type
+    lo = np.minimum(sym[pair_inds[:, 0]], sym[pair_inds[:, 1]])
+    hi = np.maximum(sym[pair_inds[:, 0]], sym[pair_inds[:, 1]])
+
+    # encode each canonical pair as a single integer so that
+    # deduplication is a 1-D np.unique rather than a row-wise one
+    keys = lo * (np.int64(sym.max()) + 1) + hi
+
+    _, bond_inds = np.unique(keys, return_inverse=True)
+
+    return pair_inds, bond_inds
+
+
+def _unique_angles(offmol: Molecule, sym: np.ndarray):
+    triple_inds = np.fromiter(
+        (
+            atom.molecule_atom_index
+            for angle in offmol.angles
+            for atom in angle
+        ),
+        dtype=np.int64,
+        count=3 * offmol.n_angles,
+    ).reshape(-1, 3)
+
+    # canonicalize: (a, b, c) and (c, b, a) are the same angle type
+    sym_triples = sym[triple_inds]
+    sym_triples = np.where(
+        (sym_triples[:, 0] > sym_triples[:, 2])[:, None],
+        sym_triples[:, ::-1],
+        sym_triples,
+    )
+
+    # pack each canonical triple into one uint64 (symmetry classes are
+    # bounded by n_atoms < 2 ** 16) so deduplication hashes a single
+    # integer per angle instead of a row
+    sym_triples = sym_triples.astype(np.uint64)
+    keys = (
+        (sym_triples[:, 0] << np.uint64(32))
+        | (sym_triples[:, 1] << np.uint64(16))
+        | sym_triples[:, 2]
+    )
+
+    _, angle_inds = np.unique(keys, return_inverse=True)
+
+    return triple_inds, angle_inds
+
+
+def _unique_torsions(offmol: Molecule, sym: np.ndarray):
+    quad_inds = np.fromiter(
+        (
+            atom.molecule_atom_index
+            for proper in offmol.propers
+            for atom in proper
+        ),
+        dtype=np.int64,
+        count=4 * offmol.n_propers,
+    ).reshape(-1, 4)
+
+    # canonicalize: (a, b, c, d) and (d, c, b, a) are the same torsion type
+    sym_quads = sym[quad_inds]
+    reverse = (sym_quads[:, 0] > sym_quads[:, 3]) | (
+        (sym_quads[:, 0] == sym_quads[:, 3])
+        & (sym_quads[:, 1] > sym_quads[:, 2])
+    )
+    sym_quads = np.where(reverse[:, None], sym_quads[:, ::-1], sym_quads)
+
+    # pack each canonical quad into one uint64 (symmetry classes are
+    # bounded by n_atoms < 2 ** 16) so deduplication hashes a single
+    # integer per torsion instead of a row
+    sym_quads = sym_quads.astype(np.uint64)
+    keys = (
+        (sym_quads[:, 0] << np.uint64(48))
+        | (sym_quads[:, 1] << np.uint64(32))
+        | (sym_quads[:, 2] << np.uint64(16))
+        | sym_quads[:, 3]
+    )
+
+    _, torsion_inds = np.unique(keys, return_inverse=True)
+
+    return quad_inds, torsion_inds
+
+
+def sum_by_type(values: np.ndarray, type_inds: np.ndarray, n_types=None):
+    """Sum per-term values into per-type totals in a single pass.
+
+    Grouped reductions such as "total energy contribution of each bond
+    type" or the gradient of a harmonic energy w.r.t. per-type force
+    constants have the structure `sum(values[type_inds == i])` for each
+    type `i`; `np.bincount` performs all of them in one C loop instead of
+    scattering through an (n_terms, n_types) indicator matrix.
+
+    Parameters
+    ----------
+    values : np.ndarray, shape = (n_terms,)
+        one value per valence term
+    type_inds : np.ndarray, shape = (n_terms,)
+        type id of each term, as returned by the `get_unique_*` functions
+    n_types : int, optional
+        number of types; inferred from `type_inds` if not given
+
+    Returns
+    -------
+    totals : np.ndarray, shape = (n_types,)
+    """
+    if n_types is None:
+        # a molecule without terms of some kind (e.g. no propers) yields
+        # empty type ids, whose max is undefined
+        n_types = type_inds.max() + 1 if type_inds.size > 0 else 0
+
+    return np.bincount(
+        type_inds.astype(np.intp), weights=values, minlength=n_types
+    )
+
+
+def get_unique_valence(offmol: Molecule):
+    """Label all valence terms of a molecule in a single pass.
+
+    Symmetry is perceived once and shared by the bond, angle and torsion
+    extraction, so this is cheaper than calling the three
+    `get_unique_*` functions separately.
+
+    Returns
+    -------
+    bonds : tuple of np.ndarray, shapes = (n_bonds, 2) and (n_bonds,)
+    angles : tuple of np.ndarray, shapes = (n_angles, 3) and (n_angles,)
+    torsions : tuple of np.ndarray, shapes = (n_propers, 4) and (n_propers,)
+    """
+    sym = atom_symmetry_classes(offmol)
+
+    return (
+        _unique_bonds(offmol, sym),
+        _unique_angles(offmol, sym),
+        _unique_torsions(offmol, sym),
+    )
+
+
+def get_unique_bonds(offmol: Molecule):
+    """Label each bond in the molecule by its symmetry-unique bond type.
+
+    Returns
+    -------
+    pair_inds : np.ndarray, shape = (n_bonds, 2)
+        atom indices of each bond
+    bond_inds : np.ndarray, shape = (n_bonds,)
+        unique bond type id of each bond
+    """
+    return _unique_bonds(offmol, atom_symmetry_classes(offmol))
+
+
+def get_unique_angles(offmol: Molecule):
+    """Label each angle in the molecule by its symmetry-unique angle type.
+
+    Returns
+    -------
+    triple_inds : np.ndarray, shape = (n_angles, 3)
+        atom indices of each angle
+    angle_inds : np.ndarray, shape = (n_angles,)
+        unique angle type id of each angle
+    """
+    return _unique_angles(offmol, atom_symmetry_classes(offmol))
+
+
+def get_unique_torsions(offmol: Molecule):
+    """Label each proper torsion by its symmetry-unique torsion type.
+
+    Returns
+    -------
+    quad_inds : np.ndarray, shape = (n_propers, 4)
+        atom indices of each proper torsion
+    torsion_inds : np.ndarray, shape = (n_propers,)
+        unique torsion type id of each proper torsion
+    """
+    return _unique_torsions(offmol, atom_symmetry_classes(offmol))
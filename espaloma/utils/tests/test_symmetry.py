@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def benzene():
+    from openff.toolkit.topology import Molecule
+
+    return Molecule.from_smiles("c1ccccc1")
+
+
+def test_unique_bonds_ethane():
+    from openff.toolkit.topology import Molecule
+
+    from espaloma.utils.symmetry import get_unique_bonds
+
+    ethane = Molecule.from_smiles("CC")
+    pair_inds, bond_inds = get_unique_bonds(ethane)
+
+    assert pair_inds.shape == (7, 2)
+    assert bond_inds.shape == (7,)
+
+    # ethane has two bond types: C-C and C-H
+    assert len(np.unique(bond_inds)) == 2
+
+
+def test_unique_valence_benzene(benzene):
+    from espaloma.utils.symmetry import get_unique_valence
+
+    (
+        (pair_inds, bond_inds),
+        (triple_inds, angle_inds),
+        (quad_inds, torsion_inds),
+    ) = get_unique_valence(benzene)
+
+    # C-C and C-H
+    assert pair_inds.shape == (12, 2)
+    assert len(np.unique(bond_inds)) == 2
+
+    # C-C-C and C-C-H
+    assert triple_inds.shape == (18, 3)
+    assert len(np.unique(angle_inds)) == 2
+
+    # C-C-C-C, C-C-C-H and H-C-C-H
+    assert quad_inds.shape == (24, 4)
+    assert len(np.unique(torsion_inds)) == 3
+
+
+def test_sum_by_type(benzene):
+    from espaloma.utils.symmetry import get_unique_bonds, sum_by_type
+
+    pair_inds, bond_inds = get_unique_bonds(benzene)
+    values = np.ones(len(bond_inds))
+
+    totals = sum_by_type(values, bond_inds)
+
+    # benzene has six bonds of each of its two types
+    assert np.allclose(totals, [6.0, 6.0])
+    assert totals.sum() == values.sum()
+
+
+def test_sum_by_type_empty():
+    from espaloma.utils.symmetry import sum_by_type
+
+    # a molecule with no terms of some kind (e.g. methane has no
+    # propers) produces empty type ids
+    totals = sum_by_type(np.array([]), np.array([], dtype=np.int64))
+    assert totals.shape == (0,)
+
+    totals = sum_by_type(
+        np.array([]), np.array([], dtype=np.int64), n_types=3
+    )
+    assert np.allclose(totals, np.zeros(3))
+
+
+def test_type_ids_invariant_under_reversal(benzene):
+    from espaloma.utils.symmetry import (
+        atom_symmetry_classes,
+        get_unique_valence,
+    )
+
+    sym = atom_symmetry_classes(benzene)
+
+    for inds, type_inds in get_unique_valence(benzene):
+        # terms with the same (possibly reversed) symmetry classes
+        # share a type id
+        seen = {}
+        for sym_tuple, type_ind in zip(sym[inds], type_inds):
+            for key in (tuple(sym_tuple), tuple(sym_tuple[::-1])):
+                assert seen.setdefault(key, type_ind) == type_ind